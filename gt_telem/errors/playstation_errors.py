@@ -4,6 +4,7 @@ class PlayStationNotFoundError(Exception):
 
 
 class PlayStatonOnStandbyError(Exception):
+    _MESSAGE = "Playstation %sis on standby."
+
     def __init__(self, playstation_ip):
-        message = f"Playstation {'at '+playstation_ip+' ' if playstation_ip else ''}is on standby."
-        super().__init__(message)
+        super().__init__(self._MESSAGE % ("at %s " % playstation_ip if playstation_ip else ""))
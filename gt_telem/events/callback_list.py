@@ -0,0 +1,123 @@
+import asyncio
+import functools
+import inspect
+import logging
+from typing import Callable, Iterable
+
+
+def _as_async(callback: Callable) -> Callable:
+    """
+    Wrap a plain function so it can be awaited like a coroutine function.
+
+    Parameters:
+        - callback (Callable): Function or coroutine function.
+
+    Returns:
+        Callable: A coroutine function. Coroutine functions are returned as-is.
+    """
+    if inspect.iscoroutinefunction(callback):
+        return callback
+
+    @functools.wraps(callback)
+    async def wrapper(*args):
+        result = callback(*args)
+        # e.g. an object whose __call__ is a coroutine function
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return wrapper
+
+
+class CallbackList(list):
+    """
+    List of event callbacks that accepts both plain functions and coroutine functions.
+
+    Plain functions are wrapped when they are added, so every entry can be awaited
+    when an event fires without checking its type on each telemetry packet.
+
+    Callbacks of one event run concurrently, so they should not share mutable
+    state without synchronizing it themselves. By default fire() returns once they
+    have all finished, so the next telemetry packet waits for them; with
+    fire_and_forget=True they are scheduled as tasks instead, and errors they raise
+    are logged.
+    """
+
+    def __init__(self, callbacks: Iterable[Callable] = (), fire_and_forget: bool = False):
+        """
+        Initialize the CallbackList.
+
+        Parameters:
+            - callbacks (Iterable[Callable]): Initial callbacks.
+            - fire_and_forget (bool): Schedule callbacks as tasks instead of awaiting them.
+                Default is False.
+        """
+        super().__init__(_as_async(cb) for cb in callbacks)
+        self.fire_and_forget = fire_and_forget
+        self._pending: set[asyncio.Task] = set()
+
+    async def fire(self, *args) -> None:
+        """
+        Invoke every callback with the given arguments.
+
+        Callbacks run concurrently. Unless fire_and_forget is set, this returns once
+        all of them have finished; otherwise they are scheduled as tasks and this
+        returns immediately so the next telemetry packet is not held up.
+        """
+        if not self:
+            return
+        if self.fire_and_forget:
+            for cb in self:
+                task = asyncio.create_task(cb(*args))
+                self._pending.add(task)
+                task.add_done_callback(self._task_done)
+            return
+        await asyncio.gather(*(cb(*args) for cb in self))
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"Error in event callback {task.get_coro()}: {task.exception()!r}")
+
+    def append(self, callback: Callable) -> None:
+        super().append(_as_async(callback))
+
+    def insert(self, index: int, callback: Callable) -> None:
+        super().insert(index, _as_async(callback))
+
+    def extend(self, callbacks: Iterable[Callable]) -> None:
+        super().extend(_as_async(cb) for cb in callbacks)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = [_as_async(cb) for cb in value]
+        else:
+            value = _as_async(value)
+        super().__setitem__(index, value)
+
+    def __add__(self, callbacks: Iterable[Callable]):
+        result = CallbackList(self, fire_and_forget=self.fire_and_forget)
+        result.extend(callbacks)
+        return result
+
+    def __iadd__(self, callbacks: Iterable[Callable]):
+        self.extend(callbacks)
+        return self
+
+    def __contains__(self, callback: Callable) -> bool:
+        return self._find(callback) is not None
+
+    def remove(self, callback: Callable) -> None:
+        """
+        Remove a callback, matching either the wrapper or the function originally added.
+        """
+        i = self._find(callback)
+        if i is None:
+            raise ValueError(f"{callback!r} is not registered")
+        del self[i]
+
+    def _find(self, callback: Callable):
+        for i, cb in enumerate(self):
+            if cb == callback or getattr(cb, "__wrapped__", None) == callback:
+                return i
+        return None
@@ -1,31 +1,42 @@
-from typing import Callable, List
+from operator import attrgetter, ne
 
+from gt_telem.events.callback_list import CallbackList
+from gt_telem.events.event_tracker import EventTracker
 from gt_telem.turismo_client import TurismoClient
 
 
-class DriverEvents:
+def _switched_on(last, current) -> bool:
+    """
+    True when a flag or pedal goes from off/zero to on/non-zero.
+    """
+    return not last and bool(current)
+
+
+class DriverEvents(EventTracker):
     """
     DriverEvents class for tracking driver-related events in Gran Turismo using telemetry.
 
+    Each event is a CallbackList; see CallbackList for how its callbacks are run.
+
     Attributes:
-        on_gear_change (List[Callable]): List of callbacks to be executed when the current gear changes.
-        on_flash_lights (List[Callable]): List of callbacks to be executed when the high beams are activated.
-        on_handbrake (List[Callable]): List of callbacks to be executed when the handbrake is activated.
-        on_suggested_gear (List[Callable]): List of callbacks to be executed when the suggested gear changes.
-        on_tcs (List[Callable]): List of callbacks to be executed when the Traction Control System (TCS) state changes.
-        on_asm (List[Callable]): List of callbacks to be executed when the Anti-Spin Management (ASM) state changes.
-        on_rev_limit (List[Callable]): List of callbacks to be executed when the engine reaches the rev limit.
-        on_brake (List[Callable]): List of callbacks to be executed when the brake is applied.
-        on_throttle (List[Callable]): List of callbacks to be executed when the throttle is applied.
-        on_shift_light_low (List[Callable]): List of callbacks to be executed when the engine is in the low shift light range.
-        on_shift_light_high (List[Callable]): List of callbacks to be executed when the engine is in the high shift light range.
+        on_gear_change (CallbackList): Callbacks to be executed when the current gear changes.
+        on_flash_lights (CallbackList): Callbacks to be executed when the high beams are activated.
+        on_handbrake (CallbackList): Callbacks to be executed when the handbrake is activated.
+        on_suggested_gear (CallbackList): Callbacks to be executed when the suggested gear changes.
+        on_tcs (CallbackList): Callbacks to be executed when the Traction Control System (TCS) state changes.
+        on_asm (CallbackList): Callbacks to be executed when the Anti-Spin Management (ASM) state changes.
+        on_rev_limit (CallbackList): Callbacks to be executed when the engine reaches the rev limit.
+        on_brake (CallbackList): Callbacks to be executed when the brake is applied.
+        on_throttle (CallbackList): Callbacks to be executed when the throttle is applied.
+        on_shift_light_low (CallbackList): Callbacks to be executed when the engine is in the low shift light range.
+        on_shift_light_high (CallbackList): Callbacks to be executed when the engine is in the high shift light range.
 
     Methods:
-        __init__(self, tc: TurismoClient):
+        __init__(self, tc: TurismoClient, fire_and_forget: bool=False):
             Initializes the DriverEvents instance and registers the _state_tracker callback with the provided TurismoClient.
 
-        _state_tracker(t, context):
-            Callback function to track driver-related events based on telemetry data.
+        _fire_events(last, t, changed):
+            Fires the callbacks for the driver-related events between two packets.
 
     Usage:
         # Example usage:
@@ -39,72 +50,87 @@ class DriverEvents:
         tc.run()
     """
 
-    on_gear_change: list[Callable] = []
-    on_flash_lights: list[Callable] = []
-    on_handbrake: list[Callable] = []
-    on_suggested_gear: list[Callable] = []
-    on_tcs: list[Callable] = []
-    on_asm: list[Callable] = []
-    on_rev_limit: list[Callable] = []
-    on_brake: list[Callable] = []
-    on_throttle: list[Callable] = []
-    on_shift_light_low: list[Callable] = []
-    on_shift_light_high: list[Callable] = []
-
-    def __init__(self, tc: TurismoClient):
+    __slots__ = (
+        "on_gear_change",
+        "on_flash_lights",
+        "on_handbrake",
+        "on_suggested_gear",
+        "on_tcs",
+        "on_asm",
+        "on_rev_limit",
+        "on_brake",
+        "on_throttle",
+        "on_shift_light_low",
+        "on_shift_light_high",
+        "above_min_alert_rpm",
+        "above_max_alert_rpm",
+    )
+
+    on_gear_change: CallbackList
+    on_flash_lights: CallbackList
+    on_handbrake: CallbackList
+    on_suggested_gear: CallbackList
+    on_tcs: CallbackList
+    on_asm: CallbackList
+    on_rev_limit: CallbackList
+    on_brake: CallbackList
+    on_throttle: CallbackList
+    on_shift_light_low: CallbackList
+    on_shift_light_high: CallbackList
+
+    # (callback list, telemetry value, trigger) for events fired on a change between packets
+    _EDGE_EVENTS = (
+        ("on_gear_change", attrgetter("current_gear"), ne),
+        ("on_flash_lights", attrgetter("high_beams"), _switched_on),
+        ("on_handbrake", attrgetter("hand_brake_active"), _switched_on),
+        ("on_suggested_gear", attrgetter("suggested_gear"), ne),
+        ("on_tcs", attrgetter("tcs_active"), ne),
+        ("on_asm", attrgetter("asm_active"), ne),
+        ("on_rev_limit", attrgetter("rev_limit"), ne),
+        ("on_brake", attrgetter("brake"), _switched_on),
+        ("on_throttle", attrgetter("throttle"), _switched_on),
+    )
+
+    def __init__(self, tc: TurismoClient, fire_and_forget: bool=False):
         """
         Initialize the DriverEvents instance.
 
         Parameters:
             tc (TurismoClient): The TurismoClient instance to track telemetry.
+            fire_and_forget (bool): Schedule callbacks as tasks instead of waiting for them
+                before processing the next packet. Default is False.
         """
-        tc.register_callback(DriverEvents._state_tracker, [self])
-        self.last = tc.telemetry
+        self.on_gear_change = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_flash_lights = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_handbrake = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_suggested_gear = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_tcs = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_asm = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_rev_limit = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_brake = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_throttle = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_shift_light_low = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_shift_light_high = CallbackList(fire_and_forget=fire_and_forget)
         self.above_min_alert_rpm = False
         self.above_max_alert_rpm = False
+        super().__init__(tc)
 
-    @staticmethod
-    async def _state_tracker(t, context):
+    async def _fire_events(self, last, t, changed):
         """
-        Callback function to track driver-related events based on telemetry data.
+        Fire the callbacks for everything that changed between two packets.
 
         Parameters:
-            t: Telemetry data.
-            context: The DriverEvents instance.
+            last: Telemetry the previous events were computed from.
+            t: Current telemetry data.
+            changed: Names of the triggered _EDGE_EVENTS callback lists.
         """
-        self = context
-        if not self.last:
-            self.last = t
-            return
-        if self.last.current_gear != t.current_gear:
-            [x() for x in self.on_gear_change]
-        if not self.last.high_beams and t.high_beams:
-            [x() for x in self.on_flash_lights]
-        if not self.last.hand_brake_active and t.hand_brake_active:
-            [x() for x in self.on_handbrake]
-        if self.last.suggested_gear != t.suggested_gear:
-            [x() for x in self.on_suggested_gear]
-        if self.last.tcs_active != t.tcs_active:
-            [x() for x in self.on_tcs]
-        if self.last.asm_active != t.asm_active:
-            [x() for x in self.on_asm]
-        if self.last.rev_limit != t.rev_limit:
-            [x() for x in self.on_rev_limit]
-        if self.last.brake == 0 and t.brake > 0:
-            [x() for x in self.on_brake]
-        if self.last.throttle == 0 and t.throttle > 0:
-            [x() for x in self.on_throttle]
-        if t.engine_rpm > t.min_alert_rpm:
-            if not self.above_min_alert_rpm:
-                self.above_min_alert_rpm = True
-                [x() for x in self.on_shift_light_low]
-        elif self.above_min_alert_rpm:
-            self.above_min_alert_rpm = False
-        if t.engine_rpm > t.max_alert_rpm:
-            if not self.above_max_alert_rpm:
-                self.above_max_alert_rpm = True
-                [x() for x in self.on_shift_light_high]
-        elif self.above_max_alert_rpm:
-            self.above_max_alert_rpm = False
-
-        self.last = t
+        await super()._fire_events(last, t, changed)
+        rpm = t.engine_rpm
+        above_min = rpm > t.min_alert_rpm
+        if above_min and not self.above_min_alert_rpm and self.on_shift_light_low:
+            await self.on_shift_light_low.fire()
+        self.above_min_alert_rpm = above_min
+        above_max = rpm > t.max_alert_rpm
+        if above_max and not self.above_max_alert_rpm and self.on_shift_light_high:
+            await self.on_shift_light_high.fire()
+        self.above_max_alert_rpm = above_max
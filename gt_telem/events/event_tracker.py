@@ -0,0 +1,85 @@
+import logging
+import weakref
+
+from gt_telem.turismo_client import TurismoClient
+
+
+class EventTracker:
+    """
+    Base class for events that fire when telemetry changes between packets.
+
+    Subclasses describe their change-driven events in _EDGE_EVENTS as
+    (callback list attribute, telemetry getter, trigger) rows. Only one callback
+    is registered per TurismoClient and subclass: the triggered events are worked
+    out once per packet and shared by every instance listening to that client.
+    """
+
+    __slots__ = ("last",)
+
+    _EDGE_EVENTS: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._contexts = weakref.WeakKeyDictionary()
+
+    def __init__(self, tc: TurismoClient):
+        """
+        Register the instance with the shared tracker of a TurismoClient.
+
+        Parameters:
+            tc (TurismoClient): The TurismoClient instance to track telemetry.
+        """
+        self.last = tc.telemetry
+        contexts = type(self)._contexts.get(tc)
+        if contexts is None:
+            contexts = type(self)._contexts[tc] = []
+            tc.register_callback(type(self)._state_tracker, [contexts])
+        contexts.append(self)
+
+    @classmethod
+    async def _state_tracker(cls, t, contexts):
+        """
+        Callback function to track events for every instance on a client.
+
+        Each edge event is only compared when the instance has callbacks for it, and
+        each comparison is shared by the instances that last saw the same packet. An
+        instance whose callbacks raise is logged and skipped; the others still fire.
+
+        Parameters:
+            t: Telemetry data.
+            contexts: The instances registered on the client.
+        """
+        triggered = {}
+        for self in contexts:
+            last = self.last
+            if not last:
+                self.last = t
+                continue
+            try:
+                results = triggered.setdefault(id(last), {})
+                changed = []
+                for name, get, trigger in cls._EDGE_EVENTS:
+                    if not getattr(self, name):
+                        continue
+                    fired = results.get(name)
+                    if fired is None:
+                        fired = results[name] = trigger(get(last), get(t))
+                    if fired:
+                        changed.append(name)
+                await self._fire_events(last, t, changed)
+            except Exception as e:
+                logging.error(f"Error firing {cls.__name__} events: {e}")
+            finally:
+                self.last = t
+
+    async def _fire_events(self, last, t, changed):
+        """
+        Fire the callbacks for everything that changed between two packets.
+
+        Parameters:
+            last: Telemetry the previous events were computed from.
+            t: Current telemetry data.
+            changed: Names of the triggered _EDGE_EVENTS callback lists.
+        """
+        for name in changed:
+            await getattr(self, name).fire()
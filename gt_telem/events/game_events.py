@@ -3,6 +3,7 @@ import logging
 from enum import Enum
 from typing import Callable, List
 
+from gt_telem.events.callback_list import CallbackList
 from gt_telem.turismo_client import TurismoClient
 
 
@@ -17,21 +18,27 @@ class GameState(Enum):
 
 
 class GameEvents:
-    on_running: list[Callable] = []
-    on_in_game_menu: list[Callable] = []
-    on_at_track: list[Callable] = []
-    on_in_race: list[Callable] = []
-    on_paused: list[Callable] = []
-    on_race_end: list[Callable] = []
-
-    def __init__(self, tc: TurismoClient):
+    on_running: list[Callable]
+    on_in_game_menu: list[Callable]
+    on_at_track: list[Callable]
+    on_in_race: list[Callable]
+    on_paused: list[Callable]
+    on_race_end: list[Callable]
+
+    def __init__(self, tc: TurismoClient, fire_and_forget: bool=False):
+        self.on_running = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_in_game_menu = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_at_track = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_in_race = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_paused = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_race_end = CallbackList(fire_and_forget=fire_and_forget)
         self.game_state: GameState = GameState.NOT_RUNNING
         self.check_next = 0
         self.tod = tc.telemetry.time_of_day_ms if tc.telemetry else 0
         self.last = tc.telemetry
         tc.register_callback(GameEvents._state_tracker, [self])
 
-    def _change_state(self, state: GameState):
+    async def _change_state(self, state: GameState):
         events = None
         match state:
             case GameState.RUNNING:
@@ -47,9 +54,9 @@ class GameEvents:
             case GameState.END_RACE:
                 events = self.on_race_end
             case _:
-                events = []
-        for event in events:
-            event()
+                events = None
+        if events:
+            await events.fire()
         self.game_state = state
 
     @staticmethod
@@ -63,7 +70,7 @@ class GameEvents:
         if self.game_state == GameState.NOT_RUNNING:
             if t is None:
                 return
-            self._change_state(GameState.RUNNING)
+            await self._change_state(GameState.RUNNING)
             logging.debug("Game is running.")
 
         match self.game_state:
@@ -71,41 +78,41 @@ class GameEvents:
                 if t.cars_on_track:
                     if t.is_paused:
                         logging.debug("Race is paused.")
-                        self._change_state(GameState.PAUSED)
+                        await self._change_state(GameState.PAUSED)
                     if t.time_of_day_ms == 43200000:
                         logging.debug("End of a Race.")
-                        self._change_state(GameState.END_RACE)
+                        await self._change_state(GameState.END_RACE)
                     else:
                         logging.debug("In a Race.")
-                        self._change_state(GameState.IN_RACE)
+                        await self._change_state(GameState.IN_RACE)
                 else:
                     if t.current_lap > -1:
                         logging.debug("At a track")
-                        self._change_state(GameState.AT_TRACK)
+                        await self._change_state(GameState.AT_TRACK)
                     else:
                         logging.debug("In a menu.")
-                        self._change_state(GameState.IN_MENU)
+                        await self._change_state(GameState.IN_MENU)
 
             case GameState.IN_MENU:
                 if t.current_lap > -1:
                     logging.debug("At a track")
-                    self._change_state(GameState.AT_TRACK)
+                    await self._change_state(GameState.AT_TRACK)
 
             case GameState.AT_TRACK:
                 if t.cars_on_track and t.current_lap == 0:
                     logging.debug("In a Race.")
-                    self._change_state(GameState.IN_RACE)
+                    await self._change_state(GameState.IN_RACE)
                 elif t.current_lap == -1:
                     logging.debug("In a menu.")
-                    self._change_state(GameState.IN_MENU)
+                    await self._change_state(GameState.IN_MENU)
 
             case GameState.IN_RACE:
                 if t.is_paused:
                     logging.debug("Race is paused.")
-                    self._change_state(GameState.PAUSED)
+                    await self._change_state(GameState.PAUSED)
                 elif t.current_lap == -1:
                     logging.debug("Race ended.")
-                    self._change_state(GameState.END_RACE)
+                    await self._change_state(GameState.END_RACE)
 
             case GameState.PAUSED:
                 if not t.is_paused:
@@ -125,15 +132,15 @@ class GameEvents:
                             self.check_next = 0
                             if t.engine_rpm != self.engine_rpm:
                                 logging.debug("Resuming Race")
-                                self._change_state(GameState.IN_RACE)
+                                await self._change_state(GameState.IN_RACE)
                             else:
                                 logging.debug("Quit Race")
-                                self._change_state(GameState.END_RACE)
+                                await self._change_state(GameState.END_RACE)
 
             case GameState.END_RACE:
                 if t.total_laps == 0 and self.last.current_lap != t.current_lap:
                     logging.debug("At a track")
-                    self._change_state(GameState.AT_TRACK)
+                    await self._change_state(GameState.AT_TRACK)
 
             case _:
                 logging.debug(f"Unhandled state: {self.game_state}")
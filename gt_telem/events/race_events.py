@@ -1,25 +1,29 @@
-from typing import Callable, List
+from operator import attrgetter, ne
 
+from gt_telem.events.callback_list import CallbackList
+from gt_telem.events.event_tracker import EventTracker
 from gt_telem.turismo_client import TurismoClient
 
 
-class RaceEvents:
+class RaceEvents(EventTracker):
     """
     RaceEvents class for tracking race events in Gran Turismo using telemetry.
 
+    Each event is a CallbackList; see CallbackList for how its callbacks are run.
+
     Attributes:
-        on_race_start (List[Callable]): List of callbacks to be executed when a race starts.
-        on_race_finish (List[Callable]): List of callbacks to be executed when a driver finishes the last lap.
-        on_lap_change (List[Callable]): List of callbacks to be executed when the lap changes.
-        on_best_lap_time (List[Callable]): List of callbacks to be executed when the best lap time changes.
-        on_last_lap_time (List[Callable]): List of callbacks to be executed when the last lap time changes.
+        on_race_start (CallbackList): Callbacks to be executed when a race starts.
+        on_race_finish (CallbackList): Callbacks to be executed when a driver finishes the last lap.
+        on_lap_change (CallbackList): Callbacks to be executed when the lap changes.
+        on_best_lap_time (CallbackList): Callbacks to be executed when the best lap time changes.
+        on_last_lap_time (CallbackList): Callbacks to be executed when the last lap time changes.
 
     Methods:
-        __init__(self, tc: TurismoClient):
+        __init__(self, tc: TurismoClient, fire_and_forget: bool=False):
             Initializes the RaceEvents instance and registers the _state_tracker callback with the provided TurismoClient.
 
-        _state_tracker(t, context):
-            Callback function to track race events based on telemetry data.
+        _fire_events(last, t, changed):
+            Fires the callbacks for the race events between two packets.
 
     Usage:
         # Example usage:
@@ -34,47 +38,58 @@ class RaceEvents:
         asyncio.run(tc.run())
     """
 
-    on_race_start: list[Callable] = []
-    on_race_finish: list[Callable] = []
-    on_lap_change: list[Callable] = []
-    on_best_lap_time: list[Callable] = []
-    on_last_lap_time: list[Callable] = []
+    __slots__ = (
+        "on_race_start",
+        "on_race_finish",
+        "on_lap_change",
+        "on_best_lap_time",
+        "on_last_lap_time",
+        "race_running",
+    )
+
+    on_race_start: CallbackList
+    on_race_finish: CallbackList
+    on_lap_change: CallbackList
+    on_best_lap_time: CallbackList
+    on_last_lap_time: CallbackList
+
+    # (callback list, telemetry value, trigger) for events fired on a change between packets
+    _EDGE_EVENTS = (
+        ("on_lap_change", attrgetter("current_lap"), ne),
+        ("on_best_lap_time", attrgetter("best_lap_time_ms"), ne),
+        ("on_last_lap_time", attrgetter("last_lap_time_ms"), ne),
+    )
 
-    def __init__(self, tc: TurismoClient):
+    def __init__(self, tc: TurismoClient, fire_and_forget: bool=False):
         """
         Initialize the RaceEvents instance.
 
         Parameters:
             tc (TurismoClient): The TurismoClient instance to track telemetry.
+            fire_and_forget (bool): Schedule callbacks as tasks instead of waiting for them
+                before processing the next packet. Default is False.
         """
-        tc.register_callback(RaceEvents._state_tracker, [self])
-        self.last = tc.telemetry
+        self.on_race_start = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_race_finish = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_lap_change = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_best_lap_time = CallbackList(fire_and_forget=fire_and_forget)
+        self.on_last_lap_time = CallbackList(fire_and_forget=fire_and_forget)
         self.race_running = False
+        super().__init__(tc)
 
-    @staticmethod
-    async def _state_tracker(t, context):
+    async def _fire_events(self, last, t, changed):
         """
-        Callback function to track race events based on telemetry data.
+        Fire the callbacks for everything that changed between two packets.
 
         Parameters:
-            t: Telemetry data.
-            context: The RaceEvents instance.
+            last: Telemetry the previous events were computed from.
+            t: Current telemetry data.
+            changed: Names of the triggered _EDGE_EVENTS callback lists.
         """
-        self = context
-        if not self.last:
-            self.last = t
-            return
-        if self.last.current_lap == 0 and t.current_lap == 1:
+        if last.current_lap == 0 and t.current_lap == 1:
             self.race_running = True
-            [x() for x in self.on_race_start]
+            await self.on_race_start.fire()
         if self.race_running and t.total_laps + 1 == t.current_lap:
             self.race_running = False
-            [x() for x in self.on_race_finish]
-        if self.last.current_lap != t.current_lap:
-            [x() for x in self.on_lap_change]
-        if self.last.best_lap_time != t.best_lap_time:
-            [x() for x in self.on_best_lap_time]
-        if self.last.last_lap_time != t.last_lap_time:
-            [x() for x in self.on_last_lap_time]
-
-        self.last = t
+            await self.on_race_finish.fire()
+        await super()._fire_events(last, t, changed)
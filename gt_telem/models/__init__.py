@@ -1,4 +1,6 @@
-from .helpers import SpanReader, format_time, format_time_of_day
-from .models import Vector3D, WheelMetric
+from .helpers import SpanReader, format_time, format_time_of_day, split_gears
+from .models import (Vector3D, Vector3DColumns, WheelMetric,
+                     WheelMetricColumns)
 from .telemetry import Telemetry
+from .telemetry_batch import TelemetryBatch
 from .telemetry_packet import TelemetryPacket
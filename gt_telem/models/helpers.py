@@ -1,4 +1,33 @@
 import struct
+from functools import lru_cache
+
+
+class cached_slot_property:
+    """
+    Like functools.cached_property, for classes whose instances have no __dict__.
+
+    Values are stored in the instance's _cache dict, which the class must provide.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
+
+
+_TIME_FORMAT = "{:02}:{:02}.{:03}".format
+_CLOCK_FORMAT = "{:02}:{:02}:{:02}".format
+_AM_PM_FORMAT = "{:02}:{:02}:{:02} {}".format
 
 
 def format_time(milliseconds):
@@ -11,10 +40,7 @@ def format_time(milliseconds):
     Returns:
         str: Formatted time string.
     """
-    milliseconds = max(0, int(milliseconds))
-    minutes, milliseconds = divmod(milliseconds, 60000)
-    seconds, milliseconds = divmod(milliseconds, 1000)
-    return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
+    return _format_time(max(0, int(milliseconds)))
 
 
 def format_time_of_day(milliseconds, use_24hr=False):
@@ -29,16 +55,38 @@ def format_time_of_day(milliseconds, use_24hr=False):
         str: Formatted time of day string.
     """
     milliseconds = max(0, int(milliseconds))
-    hours, milliseconds = divmod(milliseconds, 3600000)
+    if use_24hr:
+        return _format_am_pm(milliseconds)
+    return _format_clock(milliseconds)
+
+
+def split_gears(bits):
+    """
+    Current and suggested gear from the packed bits field (low and high nibble).
+    """
+    return bits & 0b1111, bits >> 4
+
+
+@lru_cache(maxsize=4096)
+def _format_time(milliseconds):
     minutes, milliseconds = divmod(milliseconds, 60000)
     seconds, milliseconds = divmod(milliseconds, 1000)
+    return _TIME_FORMAT(minutes, seconds, milliseconds)
+
+
+@lru_cache(maxsize=4096)
+def _format_clock(milliseconds):
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    return _CLOCK_FORMAT(hours, minutes, milliseconds // 1000)
 
-    if use_24hr:
-        am_pm = "AM" if hours < 12 else "PM"
-        hours = hours % 12 or 12
-        return f"{hours:02}:{minutes:02}:{seconds:02} {am_pm}"
-    else:
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+@lru_cache(maxsize=4096)
+def _format_am_pm(milliseconds):
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    am_pm = "AM" if hours < 12 else "PM"
+    return _AM_PM_FORMAT(hours % 12 or 12, minutes, milliseconds // 1000, am_pm)
 
 
 class SpanReader:
@@ -46,6 +94,10 @@ class SpanReader:
     Utility class for reading binary data in a structured manner.
     """
 
+    # Compiled structs for the single-value readers, per byte order
+    _STRUCTS_LE = {t: struct.Struct("<" + t) for t in "ihfB"}
+    _STRUCTS_BE = {t: struct.Struct(">" + t) for t in "ihfB"}
+
     def __init__(self, data, byte_order="little"):
         """
         Initialize the SpanReader.
@@ -57,6 +109,7 @@ class SpanReader:
         self.view = memoryview(data)
         self.byte_order = "<" if byte_order == "little" else ">"
         self.position = 0
+        self._structs = self._STRUCTS_LE if self.byte_order == "<" else self._STRUCTS_BE
 
     def read_int32(self):
         """
@@ -65,10 +118,7 @@ class SpanReader:
         Returns:
             int: The read integer value.
         """
-        format_string = f"{self.byte_order}i"
-        value = struct.unpack_from(format_string, self.view, self.position)[0]
-        self.position += 4
-        return value
+        return self._read("i")
 
     def read_int16(self):
         """
@@ -77,10 +127,7 @@ class SpanReader:
         Returns:
             int: The read integer value.
         """
-        format_string = f"{self.byte_order}h"
-        value = struct.unpack_from(format_string, self.view, self.position)[0]
-        self.position += 2
-        return value
+        return self._read("h")
 
     def read_single(self):
         """
@@ -89,10 +136,7 @@ class SpanReader:
         Returns:
             float: The read floating-point value.
         """
-        format_string = f"{self.byte_order}f"
-        value = struct.unpack_from(format_string, self.view, self.position)[0]
-        self.position += 4
-        return value
+        return self._read("f")
 
     def read_byte(self):
         """
@@ -101,8 +145,12 @@ class SpanReader:
         Returns:
             int: The read byte value.
         """
-        value = struct.unpack_from("B", self.view, self.position)[0]
-        self.position += 1
+        return self._read("B")
+
+    def _read(self, code):
+        s = self._structs[code]
+        value = s.unpack_from(self.view, self.position)[0]
+        self.position += s.size
         return value
 
     def read_bytes(self, length):
@@ -1,4 +1,29 @@
-from collections import namedtuple
+from array import array
+from typing import NamedTuple
 
-WheelMetric = namedtuple("WheelMetric", ["fl", "fr", "rl", "rr"])
-Vector3D = namedtuple("Vector3D", ["x", "y", "z"])
+
+class WheelMetric(NamedTuple):
+    fl: float
+    fr: float
+    rl: float
+    rr: float
+
+
+class Vector3D(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+# Columns of a TelemetryBatch grouped like WheelMetric/Vector3D, e.g. batch.tire_temp
+class WheelMetricColumns(NamedTuple):
+    fl: array
+    fr: array
+    rl: array
+    rr: array
+
+
+class Vector3DColumns(NamedTuple):
+    x: array
+    y: array
+    z: array
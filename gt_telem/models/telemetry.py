@@ -1,8 +1,80 @@
+import time
+from dataclasses import fields
 from datetime import datetime
+from functools import cache
+from operator import attrgetter
 
-from gt_telem.models.helpers import format_time, format_time_of_day
+from gt_telem.models.helpers import (cached_slot_property, format_time,
+                                     format_time_of_day, split_gears)
 from gt_telem.models.models import Vector3D, WheelMetric
-from gt_telem.models.telemetry_packet import TelemetryPacket
+from gt_telem.models.telemetry_packet import (MPS_TO_KPH, MPS_TO_MPH,
+                                             PACKET_STRUCTS, TelemetryPacket)
+
+# Substrings of the raw field names that as_dict replaces with properties
+_IGNORE_TOKENS = (
+    "_x",
+    "_y",
+    "_z",
+    "flags",
+    "bits",
+    "empty",
+    "unused",
+    "_fl",
+    "_fr",
+    "_rl",
+    "_rr",
+)
+
+
+@cache
+def _kept_field_names(cls):
+    """
+    Fields of a Telemetry class that as_dict copies as they are; the others are
+    replaced by properties.
+    """
+    return tuple(
+        f.name for f in fields(cls) if not any(token in f.name for token in _IGNORE_TOKENS)
+    )
+
+
+@cache
+def _required_dict_keys(cls):
+    """
+    Keys of as_dict that from_dict requires: all but the optional flags.
+    """
+    keys = dict.fromkeys(
+        _kept_field_names(cls)
+        + cls._DICT_PROPERTIES
+        + cls._DERIVED_FIELDS
+        + ("current_gear", "suggested_gear")
+        + cls._FLAG_NAMES
+    )
+    for name in cls._OPTIONAL_FLAG_NAMES:
+        keys.pop(name, None)
+    return tuple(keys)
+
+
+@cache
+def _getter(names):
+    """
+    Shared attrgetter for a tuple of attribute names.
+    """
+    return attrgetter(*names)
+
+
+# Read-only boolean property for one bit of Telemetry.flags. (No class docstring:
+# __doc__ is a slot so each flag carries its own.)
+class _FlagBit:
+    __slots__ = ("_mask", "__doc__")
+
+    def __init__(self, mask, doc=None):
+        self._mask = mask
+        self.__doc__ = doc
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return bool(instance.flags & self._mask)
 
 
 class Telemetry(TelemetryPacket):
@@ -124,50 +196,162 @@ class Telemetry(TelemetryPacket):
     - best_lap_time: Get the formatted best lap time.
     - last_lap_time: Get the formatted last lap time.
     - time_of_day: Get the formatted time of day.
+    - time: Get the time the telemetry was received.
 
     Methods
-    - as_dict: Get the state of the object in a dictionary format.
+    - from_buffer: Parse a telemetry packet body.
+    - iter_buffer: Parse packet bodies stored back to back.
+    - from_array: Get telemetry from its field values, e.g. a NumPy array.
+    - as_dict: Get the state of the object in a new dictionary.
+    - to_dict: Get the state of the object, or a subset of it, in a dictionary format.
+    - compute_derived: Get the speed and gear properties in a dictionary format.
     """
 
+    # Receive time and values of the cached properties; fields are slots of TelemetryPacket
+    __slots__ = ("_time_ns", "_cache")
+
+    _FIELD_ORDER = tuple(f.name for f in fields(TelemetryPacket))
+    _FIELD_NAMES = frozenset(_FIELD_ORDER)
+    _FIELD_TYPES = tuple(f.type for f in fields(TelemetryPacket))
+    _get_fields = attrgetter(*_FIELD_ORDER)
+
+    # Properties added by as_dict besides compute_derived and the flags, in output order
+    _DICT_PROPERTIES = (
+        "position",
+        "velocity",
+        "rotation",
+        "angular_velocity",
+        "road_plane",
+        "tire_temp",
+        "wheel_rps",
+        "tire_radius",
+        "suspension_height",
+        "best_lap_time",
+        "last_lap_time",
+        "time_of_day",
+    )
+
+    # from_dict tables: as_dict property -> raw fields it was built from
+    _VEC3_FIELDS = tuple(
+        (prop, tuple(f"{prefix}_{axis}" for axis in "xyz"))
+        for prop, prefix in (
+            ("position", "position"),
+            ("velocity", "velocity"),
+            ("rotation", "rotation"),
+            ("angular_velocity", "ang_vel"),
+            ("road_plane", "road_plane"),
+        )
+    )
+    _WHEEL_FIELDS = tuple(
+        (prop, tuple(attr.format(corner) for corner in ("fl", "fr", "rl", "rr")))
+        for prop, attr in (
+            ("tire_temp", "tire_{0}_temp"),
+            ("wheel_rps", "wheel_{0}_rps"),
+            ("tire_radius", "tire_{0}_radius"),
+            ("suspension_height", "tire_{0}_sus_height"),
+        )
+    )
+    _FLAT_FIELDS = {
+        prop: attrgetter(*names) for prop, names in _VEC3_FIELDS + _WHEEL_FIELDS
+    }
+    _DERIVED_FIELDS = ("speed_kph", "speed_mph", "best_lap_time", "last_lap_time", "time_of_day")
+    _UNUSED_FIELDS = {"empty": 0, **{f"unused{i + 1}": 0 for i in range(8)}}
+    # (flag property, docstring) in bit order; the flag properties, masks and
+    # decoders below are all generated from this table
+    _FLAGS = (
+        ("cars_on_track", "Check if there are cars on the track."),
+        ("is_paused", "Check if the simulation is paused."),
+        ("is_loading", "Check if the simulation is loading."),
+        ("in_gear", "Check if the vehicle is in gear."),
+        ("has_turbo", "Check if the vehicle has a turbo."),
+        ("rev_limit", "Check if the vehicle is at the rev limit."),
+        ("hand_brake_active", "Check if the hand brake is active."),
+        ("lights_active", "Check if the lights are active."),
+        ("high_beams", "Check if the high beams are active."),
+        ("low_beams", "Check if the low beams are active."),
+        ("asm_active", "Check if the ASM (Active Stability Management) is active."),
+        ("tcs_active", "Check if the TCS (Traction Control System) is active."),
+        ("unknown_bool_1", "Get the value of an unknown boolean flag."),
+        ("unknown_bool_2", "Not sure"),
+        ("unknown_bool_3", "Get the value of another unknown boolean flag."),
+        ("unknown_bool_4", "Get the value of another unknown boolean flag."),
+    )
+    _FLAG_NAMES = tuple(name for name, _ in _FLAGS)
+    _FLAG_BITS = tuple(1 << bit for bit in range(len(_FLAGS)))
+    # flag property -> bit mask; clutch_out is a legacy name for bit 13
+    _FLAG_MASKS = tuple(zip(_FLAG_NAMES, _FLAG_BITS)) + (("clutch_out", 1 << 13),)
+    # Flags from_dict may do without; older as_dict output has no unknown flags
+    _OPTIONAL_FLAG_NAMES = _FLAG_NAMES[12:] + ("clutch_out",)
+    # Keys from_dict accepts: the raw fields and everything as_dict adds
+    _DICT_KEYS = _FIELD_NAMES.union(
+        _DICT_PROPERTIES,
+        _DERIVED_FIELDS,
+        ("current_gear", "suggested_gear"),
+        (name for name, _ in _FLAG_MASKS),
+    )
+
     def __post_init__(self):
-        self.time = datetime.now()
+        self._time_ns = time.time_ns()
+        self._cache = {}
 
     @property
+    def time(self) -> datetime:
+        """
+        Get the time the telemetry was received.
+        """
+        return datetime.fromtimestamp(self._time_ns / 1e9)
+
+    @cached_slot_property
+    def _flag_bits(self) -> tuple:
+        """
+        The 16 flag bits as booleans, lowest bit first.
+        """
+        flags = self.flags
+        return tuple(bool(flags & mask) for mask in self._FLAG_BITS)
+
+    @cached_slot_property
+    def _gears(self) -> tuple:
+        """
+        The current and suggested gear, both packed in bits.
+        """
+        return split_gears(self.bits)
+
+    @cached_slot_property
     def position(self) -> Vector3D:
         """
         Get the position as a Vector3D.
         """
         return Vector3D(self.position_x, self.position_y, self.position_z)
 
-    @property
+    @cached_slot_property
     def velocity(self) -> Vector3D:
         """
         Get the velocity as a Vector3D.
         """
         return Vector3D(self.velocity_x, self.velocity_y, self.velocity_z)
 
-    @property
+    @cached_slot_property
     def rotation(self) -> Vector3D:
         """
         Get the rotation as a Vector3D.
         """
         return Vector3D(self.rotation_x, self.rotation_y, self.rotation_z)
 
-    @property
+    @cached_slot_property
     def angular_velocity(self) -> Vector3D:
         """
         Get the angular velocity as a Vector3D.
         """
         return Vector3D(self.ang_vel_x, self.ang_vel_y, self.ang_vel_z)
 
-    @property
+    @cached_slot_property
     def road_plane(self) -> Vector3D:
         """
         Get the road plane coordinates as a Vector3D.
         """
         return Vector3D(self.road_plane_x, self.road_plane_y, self.road_plane_z)
 
-    @property
+    @cached_slot_property
     def tire_temp(self) -> WheelMetric:
         """
         Get tire temperatures as a WheelMetric.
@@ -176,7 +360,7 @@ class Telemetry(TelemetryPacket):
             self.tire_fl_temp, self.tire_fr_temp, self.tire_rl_temp, self.tire_rr_temp
         )
 
-    @property
+    @cached_slot_property
     def wheel_rps(self) -> WheelMetric:
         """
         Get wheel revolutions per second as a WheelMetric.
@@ -185,7 +369,7 @@ class Telemetry(TelemetryPacket):
             self.wheel_fl_rps, self.wheel_fr_rps, self.wheel_rl_rps, self.wheel_rr_rps
         )
 
-    @property
+    @cached_slot_property
     def tire_radius(self) -> WheelMetric:
         """
         Get tire radii as a WheelMetric.
@@ -197,7 +381,7 @@ class Telemetry(TelemetryPacket):
             self.tire_rr_radius,
         )
 
-    @property
+    @cached_slot_property
     def suspension_height(self) -> WheelMetric:
         """
         Get suspension heights as a WheelMetric.
@@ -214,298 +398,232 @@ class Telemetry(TelemetryPacket):
         """
         Get the current gear.
         """
-        return self.bits & 0b1111
+        return self._gears[0]
 
     @property
     def suggested_gear(self) -> int:
         """
         Get the suggested gear.
         """
-        return self.bits >> 4
+        return self._gears[1]
 
     @property
     def speed_kph(self) -> float:
         """
         Get the speed in kilometers per hour.
         """
-        return self.speed_mps * 3.6
+        return self.speed_mps * MPS_TO_KPH
 
     @property
     def speed_mph(self) -> float:
         """
         Get the speed in miles per hour.
         """
-        return self.speed_mps * 2.23694
+        return self.speed_mps * MPS_TO_MPH
 
-    @property
-    def cars_on_track(self) -> bool:
+    @cached_slot_property
+    def best_lap_time(self) -> str:
         """
-        Check if there are cars on the track.
+        Get the formatted best lap time.
         """
-        return bool(1<<0 & self.flags)
+        if self.best_lap_time_ms == -1:
+            return None
+        return format_time(self.best_lap_time_ms)
 
-    @property
-    def is_paused(self) -> bool:
+    @cached_slot_property
+    def last_lap_time(self) -> str:
         """
-        Check if the simulation is paused.
+        Get the formatted last lap time.
         """
-        return bool(1<<1 & self.flags)
+        if self.last_lap_time_ms == -1:
+            return None
+        return format_time(self.last_lap_time_ms)
 
-    @property
-    def is_loading(self) -> bool:
+    @cached_slot_property
+    def time_of_day(self) -> str:
         """
-        Check if the simulation is loading.
+        Get the formatted time of day.
         """
-        return bool(1<<2 & self.flags)
+        if self.time_of_day_ms == -1:
+            return None
+        return format_time_of_day(self.time_of_day_ms)
 
     @property
-    def in_gear(self) -> bool:
-        """
-        Check if the vehicle is in gear.
+    def as_dict(self):
         """
-        return bool(1<<3 & self.flags)
+        Returns a dictionary containing the state of the object.
 
-    @property
-    def has_turbo(self) -> bool:
-        """
-        Check if the vehicle has a turbo.
+        Each access builds a new dictionary from the cached vector, wheel and flag
+        values, so callers may modify it without affecting other readers.
         """
-        return bool(1<<4 & self.flags)
+        return self.to_dict()
 
-    @property
-    def rev_limit(self) -> bool:
-        """
-        Check if the vehicle is at the rev limit.
+    def to_dict(self, names=None, flat=False):
         """
-        return bool(1<<5 & self.flags)
+        Returns a dictionary containing the state of the object.
 
-    @property
-    def hand_brake_active(self) -> bool:
-        """
-        Check if the hand brake is active.
-        """
-        return bool(1<<6 & self.flags)
+        Parameters:
+            - names (Iterable[str]): Keys of as_dict to include. Default is all of them.
+                Properties that are not requested are not computed.
+            - flat (bool): Return vectors and wheel metrics as plain lists instead of
+                Vector3D/WheelMetric, e.g. for JSON encoders. Default is False.
+
+        Returns:
+            dict: The requested values.
+        """
+        if names is None:
+            kept = _kept_field_names(type(self))
+            result = dict(zip(kept, _getter(kept)(self)))
+            result.update(self.compute_derived())
+            result.update(zip(self._FLAG_NAMES, self._flag_bits))
+            if not flat:
+                props = self._DICT_PROPERTIES
+                result.update(zip(props, _getter(props)(self)))
+                return result
+            names = self._DICT_PROPERTIES
+        else:
+            result = {}
+        flat_fields = self._FLAT_FIELDS if flat else {}
+        for name in names:
+            get_raw = flat_fields.get(name)
+            result[name] = getattr(self, name) if get_raw is None else list(get_raw(self))
+        return result
 
-    @property
-    def lights_active(self) -> bool:
-        """
-        Check if the lights are active.
+    def compute_derived(self):
         """
-        return bool(1<<7 & self.flags)
+        Compute the speed and gear properties together.
 
-    @property
-    def high_beams(self) -> bool:
-        """
-        Check if the high beams are active.
+        Returns:
+            dict: speed_kph, speed_mph, current_gear and suggested_gear.
         """
-        return bool(1<<8 & self.flags)
+        speed = self.speed_mps
+        current_gear, suggested_gear = self._gears
+        return {
+            "speed_kph": speed * MPS_TO_KPH,
+            "speed_mph": speed * MPS_TO_MPH,
+            "current_gear": current_gear,
+            "suggested_gear": suggested_gear,
+        }
 
-    @property
-    def low_beams(self) -> bool:
+    @classmethod
+    def from_buffer(cls, buffer, offset=0, byte_order="little"):
         """
-        Check if the low beams are active.
-        """
-        return bool(1<<9 & self.flags)
+        Parse a decrypted telemetry packet body.
 
-    @property
-    def asm_active(self) -> bool:
-        """
-        Check if the ASM (Active Stability Management) is active.
-        """
-        return bool(1<<10 & self.flags)
+        Parameters:
+            - buffer: Bytes-like object holding the packet.
+            - offset (int): Position of the body in buffer, after the header. Default is 0.
+            - byte_order (str): 'little' or 'big'. Default is 'little'.
 
-    @property
-    def tcs_active(self) -> bool:
-        """
-        Check if the TCS (Traction Control System) is active.
+        Returns:
+            Telemetry: The parsed telemetry.
         """
-        return bool(1<<11 & self.flags)
+        return cls(*PACKET_STRUCTS[byte_order].unpack_from(buffer, offset))
 
-    @property
-    def unknown_bool_1(self) -> bool:
+    @classmethod
+    def iter_buffer(cls, buffer, byte_order="little"):
         """
-        Get the value of an unknown boolean flag.
-        """
-        return bool(1<<12 & self.flags)
+        Parse packet bodies stored back to back, e.g. a raw recording, one at a time.
 
-    @property
-    def unknown_bool_2(self) -> bool:
-        """
-        Not sure
-        """
-        return bool(1<<13 & self.flags)
+        Parameters:
+            - buffer: Bytes-like object whose length is a multiple of the packet body size.
+            - byte_order (str): 'little' or 'big'. Default is 'little'.
 
-    @property
-    def unknown_bool_3(self) -> bool:
-        """
-        Get the value of another unknown boolean flag.
+        Yields:
+            Telemetry: The parsed telemetry of each packet.
         """
-        return bool(1<<14 & self.flags)
+        for values in PACKET_STRUCTS[byte_order].iter_unpack(buffer):
+            yield cls(*values)
 
-    @property
-    def unknown_bool_4(self) -> bool:
-        """
-        Get the value of another unknown boolean flag.
+    def __array__(self, dtype=None, copy=None):
         """
-        return bool(1<<15 & self.flags)
+        Get the packet fields, in field order, as a NumPy array. Requires numpy.
 
-    @property
-    def best_lap_time(self) -> str:
-        """
-        Get the formatted best lap time.
-        """
-        if self.best_lap_time_ms == -1:
-            return None
-        return format_time(self.best_lap_time_ms)
+        Parameters:
+            - dtype: Array dtype. Default is float64, which holds every field exactly.
 
-    @property
-    def last_lap_time(self) -> str:
-        """
-        Get the formatted last lap time.
+        Returns:
+            numpy.ndarray: One value per TelemetryPacket field.
         """
-        if self.last_lap_time_ms == -1:
-            return None
-        return format_time(self.last_lap_time_ms)
+        import numpy as np
 
-    @property
-    def time_of_day(self) -> str:
-        """
-        Get the formatted time of day.
-        """
-        if self.time_of_day_ms == -1:
-            return None
-        return format_time_of_day(self.time_of_day_ms)
+        return np.fromiter(
+            self._get_fields(self), dtype=dtype or np.float64, count=len(self._FIELD_ORDER)
+        )
 
-    @property
-    def as_dict(self):
+    @classmethod
+    def from_array(cls, values):
         """
-        Returns a dictionary containing the state of the object.
-        """
-        remove_keys = [
-            x
-            for x in self.__dict__.keys()
-            if any(
-                ignore in x
-                for ignore in [
-                    "_x",
-                    "_y",
-                    "_z",
-                    "flags",
-                    "bits",
-                    "empty",
-                    "unused",
-                    "_fl",
-                    "_fr",
-                    "_rl",
-                    "_rr",
-                ]
-            )
-        ]
-
-        added = {
-            "position": self.position,
-            "velocity": self.velocity,
-            "rotation": self.rotation,
-            "angular_velocity": self.angular_velocity,
-            "road_plane": self.road_plane,
-            "tire_temp": self.tire_temp,
-            "wheel_rps": self.wheel_rps,
-            "tire_radius": self.tire_radius,
-            "suspension_height": self.suspension_height,
-            "current_gear": self.current_gear,
-            "suggested_gear": self.suggested_gear,
-            "speed_kph": self.speed_kph,
-            "speed_mph": self.speed_mph,
-            "cars_on_track": self.cars_on_track,
-            "is_paused": self.is_paused,
-            "is_loading": self.is_loading,
-            "in_gear": self.in_gear,
-            "has_turbo": self.has_turbo,
-            "rev_limit": self.rev_limit,
-            "hand_brake_active": self.hand_brake_active,
-            "lights_active": self.lights_active,
-            "high_beams": self.high_beams,
-            "low_beams": self.low_beams,
-            "asm_active": self.asm_active,
-            "tcs_active": self.tcs_active,
-            "unknown_bool_1": self.unknown_bool_1,
-            "unknown_bool_2": self.unknown_bool_2,
-            "unknown_bool_3": self.unknown_bool_3,
-            "unknown_bool_4": self.unknown_bool_4,
-            "best_lap_time": self.best_lap_time,
-            "last_lap_time": self.last_lap_time,
-            "time_of_day": self.time_of_day,
-        }
+        Get telemetry instance from the packet fields in field order, e.g. a row of
+        numpy.asarray(telemetry).
 
-        result = dict(self.__dict__, **added)
-        for remove_key in remove_keys:
-            result.pop(remove_key, None)
+        Parameters:
+            - values (Iterable): One value per TelemetryPacket field.
 
-        return result
+        Returns:
+            Telemetry: The telemetry, with each value converted to its field's type.
+
+        Raises:
+            ValueError: If the number of values does not match the fields, or a value
+                for an int field is not integral (e.g. 0.5).
+        """
+        converted = []
+        for t, v in zip(cls._FIELD_TYPES, values, strict=True):
+            value = t(v)
+            if t is int and value != v:
+                raise ValueError(f"from_array() got non-integral value {v!r} for an int field")
+            converted.append(value)
+        return cls(*converted)
 
     @staticmethod
     def from_dict(d):
         """
         Get telemetry instance from the as_dict property
         Useful for replays
-        """
 
-        # pop the vector3s
-        for vec3 in ["position", "velocity", "rotation", "angular_velocity", "road_plane"]:
-            prop = d.pop(vec3)
-            if vec3 == "angular_velocity":
-                vec3 = "ang_vel"
-            d[f"{vec3}_x"] = prop[0]
-            d[f"{vec3}_y"] = prop[1]
-            d[f"{vec3}_z"] = prop[2]
-        # pop the corners
-        for whmet, attr in {
-            "tire_temp": "tire_{0}_temp",
-            "wheel_rps": "wheel_{0}_rps",
-            "tire_radius": "tire_{0}_radius",
-            "suspension_height": "tire_{0}_sus_height"
-        }.items():
-            prop = d.pop(whmet)
-            for i, k in {
-                0: "fl",
-                1: "fr",
-                2: "rl",
-                3: "rr"
-            }.items():
-                d[attr.format(k)] = prop[i]
+        Parameters:
+            - d (dict): A dictionary in the as_dict format. It is not modified. The
+                unknown_bool_1-4 flags (and the legacy clutch_out) may be left out, as in
+                older as_dict output, and are then read as False.
+
+        Returns:
+            Telemetry: The rebuilt telemetry.
+
+        Raises:
+            TypeError: If d has keys that as_dict does not produce, is missing any other
+                as_dict key, or has a vector or wheel metric with the wrong number of values.
+        """
+        unknown = d.keys() - Telemetry._DICT_KEYS
+        if unknown:
+            raise TypeError(f"from_dict() got unknown fields: {sorted(unknown)}")
+        missing = [name for name in _required_dict_keys(Telemetry) if name not in d]
+        if missing:
+            raise TypeError(f"from_dict() missing fields: {missing}")
+
+        # Fields as_dict replaces; the input dict is only read, never changed
+        values = dict(Telemetry._UNUSED_FIELDS)
+        for prop, names in Telemetry._VEC3_FIELDS + Telemetry._WHEEL_FIELDS:
+            try:
+                values.update(zip(names, d[prop], strict=True))
+            except ValueError:
+                raise TypeError(f"from_dict() {prop} must have {len(names)} values") from None
         # rebuild the bits attr
-        sg = d.pop("suggested_gear") & 0xF
-        cg = d.pop("current_gear") & 0xF
-        d["bits"] = (sg << 4) | cg
-
-        # just remove these:
-        for prop in ["speed_kph", "speed_mph", "best_lap_time", "last_lap_time", "time_of_day"]:
-            d.pop(prop)
-
-        # Add back ones removed:
-        d["empty"] = 0
-        for i in range(8):
-            d[f"unused{i+1}"] = 0
+        values["bits"] = ((d["suggested_gear"] & 0xF) << 4) | (d["current_gear"] & 0xF)
 
         # rebuild flags
-        d["flags"] = (
-            (1<<0 if d.pop("cars_on_track") else 0) |
-            (1<<1 if d.pop("is_paused") else 0) |
-            (1<<2 if d.pop("is_loading") else 0) |
-            (1<<3 if d.pop("in_gear") else 0) |
-            (1<<4 if d.pop("has_turbo") else 0) |
-            (1<<5 if d.pop("rev_limit") else 0) |
-            (1<<6 if d.pop("hand_brake_active") else 0) |
-            (1<<7 if d.pop("lights_active") else 0) |
-            (1<<8 if d.pop("high_beams") else 0) |
-            (1<<9 if d.pop("low_beams") else 0) |
-            (1<<10 if d.pop("asm_active") else 0) |
-            (1<<11 if d.pop("tcs_active") else 0) |
-            (1<<12 if d.pop("unknown_bool_1", False) else 0) |
-            (1<<13 if d.pop("clutch_out", False) else 0) |
-            (1<<13 if d.pop("unknown_bool_2", False) else 0) |
-            (1<<14 if d.pop("unknown_bool_3", False) else 0) |
-            (1<<15 if d.pop("unknown_bool_4", False) else 0)
-        )
-
-        return Telemetry(**d)
+        flags = 0
+        for name, mask in Telemetry._FLAG_MASKS:
+            if d.get(name):
+                flags |= mask
+        # flags is a signed 16-bit field on the wire, so bit 15 makes it negative
+        values["flags"] = flags - 0x10000 if flags & 0x8000 else flags
+
+        kept = _kept_field_names(Telemetry)
+        values.update(zip(kept, map(d.__getitem__, kept)))
+        return Telemetry(*map(values.__getitem__, Telemetry._FIELD_ORDER))
+
+
+# One read-only property per flag bit, e.g. Telemetry.is_paused
+for (_name, _doc), _mask in zip(Telemetry._FLAGS, Telemetry._FLAG_BITS):
+    setattr(Telemetry, _name, _FlagBit(_mask, _doc))
+del _name, _doc, _mask
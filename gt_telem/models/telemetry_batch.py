@@ -0,0 +1,217 @@
+from array import array
+from dataclasses import fields
+from statistics import fmean
+
+from gt_telem.models.helpers import split_gears
+from gt_telem.models.models import (Vector3DColumns, WheelMetric,
+                                    WheelMetricColumns)
+from gt_telem.models.telemetry import Telemetry
+from gt_telem.models.telemetry_packet import (MPS_TO_KPH, MPS_TO_MPH,
+                                             PACKET_FORMAT, PACKET_STRUCTS,
+                                             TelemetryPacket)
+
+# (field name, array type code) for every TelemetryPacket field, expanded from
+# the wire format so each column stores values at their packet precision.
+_COLUMN_TYPES = tuple(
+    zip(
+        (f.name for f in fields(TelemetryPacket)),
+        "".join(token[-1] * int(token[:-1] or 1) for token in PACKET_FORMAT.split()),
+    )
+)
+
+# Vector and wheel properties of Telemetry -> (tuple type, columns in field order)
+_GROUPED_COLUMNS = {
+    **{prop: (Vector3DColumns, names) for prop, names in Telemetry._VEC3_FIELDS},
+    **{prop: (WheelMetricColumns, names) for prop, names in Telemetry._WHEEL_FIELDS},
+}
+
+# Speed properties of Telemetry -> factor applied to the speed_mps column
+_SPEED_FACTORS = {"speed_kph": MPS_TO_KPH, "speed_mph": MPS_TO_MPH}
+
+
+class TelemetryBatch:
+    """
+    Column-oriented store for many telemetry packets, e.g. a recorded session.
+
+    Each TelemetryPacket field is kept in one compact array.array instead of as
+    an attribute on one Telemetry object per packet. Columns are available as
+    attributes or by name (batch.speed_mps, batch["speed_mps"]), vector and wheel
+    properties return their columns grouped in a WheelMetricColumns or
+    Vector3DColumns of arrays (batch.tire_temp.fl), speed_kph and
+    speed_mph are converted for the whole column, single packets can be
+    materialized again with batch[i], and batch[i:j] is a new batch.
+
+    Usage:
+        batch = TelemetryBatch.from_packets(recorded)
+        top_speed = max(batch.speed_mps)
+        first = batch[0]
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self):
+        """
+        Initialize an empty TelemetryBatch.
+        """
+        self.columns = {name: array(code) for name, code in _COLUMN_TYPES}
+
+    @classmethod
+    def from_packets(cls, packets):
+        """
+        Build a batch from telemetry packets.
+
+        Parameters:
+            - packets (Iterable[TelemetryPacket]): Packets in the order they were received.
+
+        Returns:
+            TelemetryBatch: The new batch.
+        """
+        batch = cls()
+        batch.extend(packets)
+        return batch
+
+    @classmethod
+    def from_buffer(cls, buffer, byte_order="little"):
+        """
+        Build a batch from packet bodies stored back to back, e.g. a raw recording.
+
+        Parameters:
+            - buffer: Bytes-like object whose length is a multiple of the packet body size.
+            - byte_order (str): 'little' or 'big'. Default is 'little'.
+
+        Returns:
+            TelemetryBatch: The new batch.
+        """
+        batch = cls()
+        rows = PACKET_STRUCTS[byte_order].iter_unpack(buffer)
+        for column, values in zip(batch.columns.values(), zip(*rows)):
+            column.extend(values)
+        return batch
+
+    def append(self, packet):
+        """
+        Add one packet to the end of the batch.
+
+        Parameters:
+            - packet (TelemetryPacket): Packet to add.
+        """
+        for name, column in self.columns.items():
+            column.append(getattr(packet, name))
+
+    def extend(self, packets):
+        """
+        Add several packets to the end of the batch.
+
+        Parameters:
+            - packets (Iterable[TelemetryPacket]): Packets to add.
+        """
+        for packet in packets:
+            self.append(packet)
+
+    def row(self, index):
+        """
+        Materialize one packet of the batch.
+
+        Parameters:
+            - index (int): Position of the packet in the batch.
+
+        Returns:
+            Telemetry: A new Telemetry instance with the packet's values.
+        """
+        return Telemetry(*(column[index] for column in self.columns.values()))
+
+    def decode_flags(self):
+        """
+        Decode the flag bits of every packet in the batch.
+
+        Returns:
+            dict[str, list[bool]]: One column per flag property of Telemetry, e.g. "is_paused".
+        """
+        flags = self.columns["flags"]
+        return {
+            name: [bool(f & mask) for f in flags]
+            for name, mask in zip(Telemetry._FLAG_NAMES, Telemetry._FLAG_BITS)
+        }
+
+    def derive_metrics(self):
+        """
+        Compute the derived speed and gear columns for the whole batch in one pass.
+
+        Returns:
+            dict[str, array]: speed_kph, speed_mph, current_gear and suggested_gear columns.
+        """
+        speed_kph = array("d")
+        speed_mph = array("d")
+        current_gear = array("B")
+        suggested_gear = array("B")
+        for mps, bits in zip(self.columns["speed_mps"], self.columns["bits"]):
+            speed_kph.append(mps * MPS_TO_KPH)
+            speed_mph.append(mps * MPS_TO_MPH)
+            current, suggested = split_gears(bits)
+            current_gear.append(current)
+            suggested_gear.append(suggested)
+        return {
+            "speed_kph": speed_kph,
+            "speed_mph": speed_mph,
+            "current_gear": current_gear,
+            "suggested_gear": suggested_gear,
+        }
+
+    def tire_temp_stats(self):
+        """
+        Summarize the tire temperatures of each wheel over the batch.
+
+        Returns:
+            dict[str, WheelMetric] | None: min, mean and max temperature per wheel,
+            or None if the batch is empty.
+        """
+        if not len(self):
+            return None
+        temps = self.tire_temp
+        return {
+            "min": WheelMetric(*map(min, temps)),
+            "mean": WheelMetric(*map(fmean, temps)),
+            "max": WheelMetric(*map(max, temps)),
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            try:
+                return self._column(index)
+            except AttributeError:
+                raise KeyError(index) from None
+        if isinstance(index, slice):
+            batch = type(self)()
+            batch.columns = {name: column[index] for name, column in self.columns.items()}
+            return batch
+        if isinstance(index, int):
+            return self.row(index)
+        raise TypeError(
+            f"{type(self).__name__} indices must be integers, slices or column names, "
+            f"not {type(index).__name__}"
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def __len__(self):
+        return len(self.columns["packet_id"])
+
+    def __getattr__(self, name):
+        if name == "columns":
+            # Not set yet, e.g. while unpickling
+            raise AttributeError(name)
+        return self._column(name)
+
+    def _column(self, name):
+        columns = self.columns
+        if name in columns:
+            return columns[name]
+        if name in _GROUPED_COLUMNS:
+            group, names = _GROUPED_COLUMNS[name]
+            return group(*(columns[n] for n in names))
+        if name in _SPEED_FACTORS:
+            factor = _SPEED_FACTORS[name]
+            return array("d", (mps * factor for mps in columns["speed_mps"]))
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
@@ -1,7 +1,21 @@
+import struct
 from dataclasses import dataclass
 
+# Wire layout of a telemetry packet body (after the 4-byte header).
+# Codes follow the field order of TelemetryPacket; byte order is prefixed by the reader.
+PACKET_FORMAT = "27f i 2h 3i 6h 4B 16f 8i 12f i"
 
-@dataclass
+# Precompiled readers for PACKET_FORMAT, keyed by byte order.
+PACKET_STRUCTS = {
+    "little": struct.Struct("<" + PACKET_FORMAT),
+    "big": struct.Struct(">" + PACKET_FORMAT),
+}
+
+MPS_TO_KPH = 3.6
+MPS_TO_MPH = 2.23694
+
+
+@dataclass(slots=True)
 class TelemetryPacket:
     position_x: float
     position_y: float
@@ -83,3 +97,8 @@ class TelemetryPacket:
     gear7: float
     gear8: float
     car_code: int
+
+    def __post_init__(self):
+        # Hook for subclasses: the generated __init__ only calls __post_init__
+        # if it is defined here, on the decorated class.
+        pass
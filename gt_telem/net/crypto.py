@@ -2,6 +2,9 @@ import struct
 
 from salsa20 import Salsa20_xor
 
+_SEED_STRUCT = struct.Struct("<I")
+_IV_STRUCT = struct.Struct("<II")
+
 
 class PDEncyption:
     """
@@ -15,21 +18,19 @@ class PDEncyption:
 
     def __init__(self, is_gt7):
         self.is_gt7 = is_gt7
+        self._key = (self._GT7_KEY if is_gt7 else self._DEFAULT_KEY)[:32]
 
-    def decrypt(self, ciphertext: bytes) -> bytes:
+    def decrypt(self, ciphertext: bytes | bytearray | memoryview) -> bytes:
         """
         Decrypts the provided ciphertext using Salsa20 stream cipher.
 
         Parameters:
-        - ciphertext (bytes): The encrypted data to be decrypted.
-        - is_gt7 (bool): Flag indicating whether to use the GT7 key. Default is True.
+        - ciphertext (bytes-like): The encrypted data to be decrypted. Buffers such as
+          bytearray or memoryview are read in place, without copying them to bytes first.
 
         Returns:
         bytes: The decrypted plaintext.
         """
-        seed = struct.unpack("<I", ciphertext[0x40:0x44])[0]
-        iv = seed ^ self._IV_MASK
-        iv = struct.pack("<II", iv, seed)
-        return Salsa20_xor(
-            ciphertext, iv, self._GT7_KEY[:32] if self.is_gt7 else self._DEFAULT_KEY[:32]
-        )
+        seed = _SEED_STRUCT.unpack_from(ciphertext, 0x40)[0]
+        iv = _IV_STRUCT.pack(seed ^ self._IV_MASK, seed)
+        return Salsa20_xor(ciphertext, iv, self._key)
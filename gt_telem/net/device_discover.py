@@ -1,17 +1,39 @@
+import re
+import select
 import socket
 from typing import Optional, Tuple
 
 
-def _get_host_type(buffer: str) -> str:
-    for line in buffer.split("\n"):
-        if line.startswith("HTTP"):
-            code = int(line.split()[1])
-        elif line:
-            key, value = map(str.strip, line.split(":", 1))
-            if key == "host-type":
-                ps_type = value
-                break
-    return ps_type + " STANDBY" if code == 620 else ps_type
+_HOST_TYPE_RE = re.compile(rb"^host-type:[ \t]*(.+?)\s*$", re.M)
+_STATUS_CODE_RE = re.compile(rb"^HTTP\S*\s+(\d+)", re.M)
+# Status code of the discovery reply while the console is in rest mode
+_STANDBY_CODE = 620
+
+
+def _get_host_type(buffer: bytes) -> str | None:
+    """
+    Read the host type from a device discovery reply.
+
+    Parameters:
+        - buffer (bytes): The raw reply.
+
+    Returns:
+        str | None: Host type, e.g. "PS5", with " STANDBY" appended in rest mode.
+        None if the reply has no host-type header.
+    """
+    host = _HOST_TYPE_RE.search(buffer)
+    if host is None:
+        return None
+    ps_type = host.group(1).decode("utf-8")
+    code = _STATUS_CODE_RE.search(buffer)
+    if code is not None and int(code.group(1)) == _STANDBY_CODE:
+        return ps_type + " STANDBY"
+    return ps_type
+
+
+# Discovery broadcasts to send, and how long to wait for a reply to each (seconds)
+_DISCOVERY_ATTEMPTS = 3
+_DISCOVERY_TIMEOUT = 0.3
 
 
 def get_ps_ip_type() -> tuple[str | None, str | None]:
@@ -21,19 +43,21 @@ def get_ps_ip_type() -> tuple[str | None, str | None]:
     Returns:
     Tuple[Optional[str], Optional[str]]: A tuple containing the PlayStation IP address and host type.
     """
-    skt = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    skt.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    skt.settimeout(1)
-
     query = b"SRCH * HTTP/1.1\ndevice-discovery-protocol-version:00030010"
 
-    skt.sendto(query, ("<broadcast>", 9302))
-    try:
-        packet, addr = skt.recvfrom(1024)
-    except socket.timeout:
-        return None, None
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as skt:
+        skt.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        # Return as soon as a reply arrives; resend in case the query or reply was lost
+        for _ in range(_DISCOVERY_ATTEMPTS):
+            skt.sendto(query, ("<broadcast>", 9302))
+            readable, _, _ = select.select([skt], [], [], _DISCOVERY_TIMEOUT)
+            if readable:
+                packet, addr = skt.recvfrom(1024)
+                break
+        else:
+            return None, None
 
-    ps_type = _get_host_type(packet.decode("utf-8"))
+    ps_type = _get_host_type(packet)
     host_ip = addr[0]
 
     return host_ip, ps_type
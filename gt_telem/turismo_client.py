@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import logging
 import socket
 import threading
@@ -8,7 +7,6 @@ from time import sleep
 
 from gt_telem.errors.playstation_errors import (PlayStationNotFoundError,
                                                 PlayStatonOnStandbyError)
-from gt_telem.models.helpers import SpanReader
 from gt_telem.models.telemetry import Telemetry
 from gt_telem.net.crypto import PDEncyption
 from gt_telem.net.device_discover import get_ps_ip_type
@@ -17,6 +15,8 @@ from gt_telem.net.device_discover import get_ps_ip_type
 class TurismoClient:
     RECEIVE_PORT = 33339
     BIND_PORT = 33340
+    # Packet header -> byte order of the packet body
+    _HEADER_BYTE_ORDERS = {b"0S7G": "little", b"G6S0": "big"}
 
     def __init__(self, is_gt7: bool=True, ps_ip: str=None):
         """
@@ -42,28 +42,29 @@ class TurismoClient:
             self.BIND_PORT += 400
         self._crypto: PDEncyption = PDEncyption(is_gt7)
 
-        self._telem_lock: threading.Lock = threading.Lock()
         # Thread for when run w/o wait:
         self._loop_thread = threading.Thread(target=self._run_forever_threaded)
         self._telem: Telemetry = None
 
         self._telem_update_callbacks = {}
         self._telem_callback_queue = asyncio.LifoQueue(maxsize=1)
-        self._processing_callbacks = False
+        # Single worker running the callbacks, started with the first packet
+        self._callback_task: asyncio.Task = None
 
     @property
     def telemetry(self) -> Telemetry:
         """
-        Get a copy of the telemetry data.
+        Get the latest telemetry data.
+
+        The instance is returned as it is rather than copied, and the same object is
+        passed to the registered callbacks. Treat it as read-only: changing its
+        fields affects every other reader, and its cached properties (position,
+        tire_temp, the flags, ...) would no longer match them.
 
         Returns:
-            Telemetry: A copy of the telemetry data.
+            Telemetry: The latest telemetry data.
         """
-        if not self._telem:
-            return None
-        with self._telem_lock:
-            cpy: Telemetry = copy.deepcopy(self._telem)
-        return cpy
+        return self._telem
 
     @telemetry.setter
     def telemetry(self, value: Telemetry) -> None:
@@ -73,16 +74,15 @@ class TurismoClient:
         Parameters:
             - value (Telemetry): Telemetry data to set.
         """
-        with self._telem_lock:
-            self._telem = value
+        self._telem = value
 
         try:
             self._telem_callback_queue.put_nowait(value)
         except asyncio.QueueFull:
             self._telem_callback_queue.get_nowait()
             self._telem_callback_queue.put_nowait(value)
-        if not self._processing_callbacks:
-            asyncio.create_task(self._process_telemetry_callbacks())
+        if self._callback_task is None:
+            self._callback_task = asyncio.create_task(self._process_telemetry_callbacks())
 
     def register_callback(self, callback, args=None):
         """
@@ -190,11 +190,11 @@ class TurismoClient:
         """
         logging.info("Starting telemetry heartbeat.")
         msg: bytes = b"A"
-        while not self._cancellation_token.is_set():
-            udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            udp_socket.sendto(msg, (self.ip_addr, self.RECEIVE_PORT))
-            udp_socket.close()
-            await asyncio.sleep(10)
+        # One socket for the whole run; UDP needs no connection to keep up
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+            while not self._cancellation_token.is_set():
+                udp_socket.sendto(msg, (self.ip_addr, self.RECEIVE_PORT))
+                await asyncio.sleep(10)
 
     async def _listen(self, loop: asyncio.AbstractEventLoop) -> None:
         """
@@ -223,7 +223,6 @@ class TurismoClient:
         """
         Process telemetry callbacks.
         """
-        self._processing_callbacks = True
         while True:
             try:
                 # Wait for the next telemetry update callback
@@ -246,7 +245,7 @@ class TurismoClient:
                 # Handle exceptions during callback processing
                 logging.error(f"Error processing telemetry {cb}: {e}")
 
-        self._processing_callbacks = False
+        self._callback_task = None
 
     def _handle_data(self, data: bytes) -> None:
         """
@@ -261,108 +260,20 @@ class TurismoClient:
             logging.debug(f"Failed to decrypt. Error: {e}. Wrong system?")
             return
         # First 4 bytes are header and indicate which system this is
-        try:
-            header: str = message[:4].decode("ascii")
-        except Exception as e:
-            logging.debug(f"Not sure what this is \n{message[:4]}. Error: {e}")
-            return
-        message: bytes = message[4:]
-        if not header in ["0S7G", "G6S0"]:
+        byte_order = self._HEADER_BYTE_ORDERS.get(message[:4])
+        if byte_order is None:
             # bad data
-            logging.debug(f"Not sure what this is \n{header}")
+            logging.debug(f"Not sure what this is \n{message[:4]}")
             return
-        if header == "0S7G":
-            sr: SpanReader = SpanReader(message, "little")
-        else:
-            sr: SpanReader = SpanReader(message, "big")
-        self._parse_telemetry(sr)
+        self._parse_telemetry(message, byte_order, offset=4)
 
-    def _parse_telemetry(self, sr: SpanReader) -> None:
+    def _parse_telemetry(self, message: bytes, byte_order: str, offset: int=0) -> None:
         """
-        Parse telemetry data from SpanReader and update the telemetry property.
+        Parse telemetry data and update the telemetry property.
 
         Parameters:
-            - sr: SpanReader containing telemetry data.
+            - message: Decrypted telemetry packet.
+            - byte_order: Byte order of the packet, 'little' or 'big'.
+            - offset: Position of the packet body in message, after the header. Default is 0.
         """
-        self.telemetry = Telemetry(
-            position_x=sr.read_single(),
-            position_y=sr.read_single(),
-            position_z=sr.read_single(),
-            velocity_x=sr.read_single(),
-            velocity_y=sr.read_single(),
-            velocity_z=sr.read_single(),
-            rotation_x=sr.read_single(),
-            rotation_y=sr.read_single(),
-            rotation_z=sr.read_single(),
-            orientation=sr.read_single(),
-            ang_vel_x=sr.read_single(),
-            ang_vel_y=sr.read_single(),
-            ang_vel_z=sr.read_single(),
-            body_height=sr.read_single(),
-            engine_rpm=sr.read_single(),
-            iv=sr.read_single(),
-            fuel_level=sr.read_single(),
-            fuel_capacity=sr.read_single(),
-            speed_mps=sr.read_single(),
-            boost_pressure=sr.read_single(),
-            oil_pressure=sr.read_single(),
-            water_temp=sr.read_single(),
-            oil_temp=sr.read_single(),
-            tire_fl_temp=sr.read_single(),
-            tire_fr_temp=sr.read_single(),
-            tire_rl_temp=sr.read_single(),
-            tire_rr_temp=sr.read_single(),
-            packet_id=sr.read_int32(),
-            current_lap=sr.read_int16(),
-            total_laps=sr.read_int16(),
-            best_lap_time_ms=sr.read_int32(),
-            last_lap_time_ms=sr.read_int32(),
-            time_of_day_ms=sr.read_int32(),
-            race_start_pos=sr.read_int16(),
-            total_cars=sr.read_int16(),
-            min_alert_rpm=sr.read_int16(),
-            max_alert_rpm=sr.read_int16(),
-            calc_max_speed=sr.read_int16(),
-            flags=sr.read_int16(),
-            bits=sr.read_byte(),
-            throttle=sr.read_byte(),
-            brake=sr.read_byte(),
-            empty=sr.read_byte(),
-            road_plane_x=sr.read_single(),
-            road_plane_y=sr.read_single(),
-            road_plane_z=sr.read_single(),
-            road_plane_dist=sr.read_single(),
-            wheel_fl_rps=sr.read_single(),
-            wheel_fr_rps=sr.read_single(),
-            wheel_rl_rps=sr.read_single(),
-            wheel_rr_rps=sr.read_single(),
-            tire_fl_radius=sr.read_single(),
-            tire_fr_radius=sr.read_single(),
-            tire_rl_radius=sr.read_single(),
-            tire_rr_radius=sr.read_single(),
-            tire_fl_sus_height=sr.read_single(),
-            tire_fr_sus_height=sr.read_single(),
-            tire_rl_sus_height=sr.read_single(),
-            tire_rr_sus_height=sr.read_single(),
-            unused1=sr.read_int32(),
-            unused2=sr.read_int32(),
-            unused3=sr.read_int32(),
-            unused4=sr.read_int32(),
-            unused5=sr.read_int32(),
-            unused6=sr.read_int32(),
-            unused7=sr.read_int32(),
-            unused8=sr.read_int32(),
-            clutch_pedal=sr.read_single(),
-            clutch_engagement=sr.read_single(),
-            trans_rpm=sr.read_single(),
-            trans_top_speed=sr.read_single(),
-            gear1=sr.read_single(),
-            gear2=sr.read_single(),
-            gear3=sr.read_single(),
-            gear4=sr.read_single(),
-            gear5=sr.read_single(),
-            gear6=sr.read_single(),
-            gear7=sr.read_single(),
-            gear8=sr.read_single(),
-            car_code=sr.read_int32(),
-        )
+        self.telemetry = Telemetry.from_buffer(message, offset, byte_order)
@@ -0,0 +1,29 @@
+import unittest
+
+from gt_telem.net.device_discover import _get_host_type
+
+
+class TestGetHostType(unittest.TestCase):
+    def test_awake(self):
+        reply = b"HTTP/1.1 200 Ok\nhost-id:0123456789AB\nhost-type:PS5\nhost-name:PS5-123\n"
+        self.assertEqual(_get_host_type(reply), "PS5")
+
+    def test_standby(self):
+        reply = b"HTTP/1.1 620 Server Standby\r\nhost-id:0123456789AB\r\nhost-type:PS4\r\n"
+        self.assertEqual(_get_host_type(reply), "PS4 STANDBY")
+
+    def test_value_with_spaces(self):
+        reply = b"HTTP/1.1 200 Ok\r\nhost-type: PS5 Pro \r\nhost-name:PS5-123\r\n"
+        self.assertEqual(_get_host_type(reply), "PS5 Pro")
+
+    def test_header_before_status_line(self):
+        reply = b"host-type:PS5\nHTTP/1.1 620 Server Standby\n"
+        self.assertEqual(_get_host_type(reply), "PS5 STANDBY")
+
+    def test_missing_headers(self):
+        self.assertIsNone(_get_host_type(b"HTTP/1.1 200 Ok\nhost-type:\nhost-name:PS5\n"))
+        self.assertEqual(_get_host_type(b"host-type:PS5\n"), "PS5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import asyncio
+import inspect
+import unittest
+from dataclasses import replace
+from operator import ne
+
+from gt_telem.events import DriverEvents
+from gt_telem.events.callback_list import CallbackList
+from gt_telem.events.event_tracker import EventTracker
+from gt_telem.models import Telemetry
+
+
+class FakeClient:
+    """
+    Stands in for TurismoClient: holds the latest telemetry and the registered callbacks.
+    """
+
+    def __init__(self):
+        self.telemetry = None
+        self.callbacks = []
+
+    def register_callback(self, callback, args=None):
+        self.callbacks.append((callback, args))
+
+    async def send(self, t):
+        self.telemetry = t
+        for cb, args in self.callbacks:
+            await cb(t, *args)
+
+
+def packet(**values):
+    return replace(Telemetry.from_buffer(bytes(292)), **values)
+
+
+class TestEventTracker(unittest.IsolatedAsyncioTestCase):
+    async def test_one_tracker_per_client(self):
+        tc = FakeClient()
+        first = DriverEvents(tc)
+        second = DriverEvents(tc)
+        self.assertEqual(len(tc.callbacks), 1)
+        self.assertEqual(tc.callbacks[0][1], [[first, second]])
+
+    async def test_failing_subscriber_does_not_stall_others(self):
+        tc = FakeClient()
+        failing = DriverEvents(tc)
+        working = DriverEvents(tc)
+        fired = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        failing.on_gear_change.append(fail)
+        working.on_gear_change.append(lambda: fired.append("gear"))
+
+        await tc.send(packet(bits=1))
+        second = packet(bits=2)
+        with self.assertLogs(level="ERROR"):
+            await tc.send(second)
+
+        self.assertEqual(fired, ["gear"])
+        self.assertIs(failing.last, second)
+        self.assertIs(working.last, second)
+
+    async def test_unsubscribed_events_are_not_compared(self):
+        reads = []
+
+        def read_lap(t):
+            reads.append(t)
+            return t.current_lap
+
+        class LapEvents(EventTracker):
+            __slots__ = ("on_lap",)
+            _EDGE_EVENTS = (("on_lap", read_lap, ne),)
+
+            def __init__(self, tc):
+                self.on_lap = CallbackList()
+                super().__init__(tc)
+
+        tc = FakeClient()
+        events = LapEvents(tc)
+        await tc.send(packet(current_lap=1))
+        await tc.send(packet(current_lap=2))
+        self.assertEqual(reads, [])
+
+        laps = []
+        events.on_lap.append(lambda: laps.append("lap"))
+        await tc.send(packet(current_lap=3))
+        self.assertEqual(len(reads), 2)
+        self.assertEqual(laps, ["lap"])
+
+
+class TestCallbackList(unittest.IsolatedAsyncioTestCase):
+    async def test_sync_callbacks_are_wrapped(self):
+        def sync_cb():
+            pass
+
+        async def async_cb():
+            pass
+
+        callbacks = CallbackList([sync_cb])
+        callbacks.append(sync_cb)
+        callbacks.insert(0, sync_cb)
+        callbacks.extend([sync_cb])
+        callbacks += [sync_cb]
+        callbacks[0] = sync_cb
+        callbacks[1:2] = [sync_cb, async_cb]
+        combined = callbacks + [sync_cb]
+
+        self.assertIsInstance(combined, CallbackList)
+        self.assertEqual(len(combined), 7)
+        for cb in combined:
+            self.assertTrue(inspect.iscoroutinefunction(cb))
+        self.assertIs(callbacks[2], async_cb)
+
+    async def test_remove_and_contains_match_the_original_function(self):
+        def sync_cb():
+            pass
+
+        callbacks = CallbackList([sync_cb])
+        self.assertIn(sync_cb, callbacks)
+        callbacks.remove(sync_cb)
+        self.assertNotIn(sync_cb, callbacks)
+        with self.assertRaises(ValueError):
+            callbacks.remove(sync_cb)
+
+    async def test_fire(self):
+        calls = []
+
+        async def async_cb(value):
+            calls.append(("async", value))
+
+        callbacks = CallbackList([lambda value: calls.append(("sync", value)), async_cb])
+        await callbacks.fire(1)
+        self.assertCountEqual(calls, [("sync", 1), ("async", 1)])
+
+    async def test_fire_async_callable_object(self):
+        calls = []
+
+        class Recorder:
+            async def __call__(self, value):
+                calls.append(value)
+
+        recorder = Recorder()
+        callbacks = CallbackList([recorder])
+        self.assertIn(recorder, callbacks)
+        await callbacks.fire(1)
+        self.assertEqual(calls, [1])
+
+    async def test_fire_and_forget(self):
+        started = asyncio.Event()
+
+        async def async_cb():
+            started.set()
+
+        callbacks = CallbackList([async_cb], fire_and_forget=True)
+        await callbacks.fire()
+        self.assertFalse(started.is_set())
+        await asyncio.wait_for(started.wait(), 1)
+
+    async def test_fire_and_forget_logs_errors(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        callbacks = CallbackList([fail], fire_and_forget=True)
+        with self.assertLogs(level="ERROR") as logs:
+            await callbacks.fire()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        self.assertIn("boom", logs.output[0])
+        self.assertFalse(callbacks._pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,20 @@
+import asyncio
+import struct
+import types
 import unittest
+from dataclasses import replace
 from datetime import datetime
 
-from gt_telem.models import Telemetry, Vector3D
+from gt_telem.models import (Telemetry, TelemetryBatch, Vector3D,
+                             Vector3DColumns, WheelMetricColumns, format_time,
+                             format_time_of_day)
+from gt_telem.models.telemetry_packet import PACKET_FORMAT
+from gt_telem.turismo_client import TurismoClient
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestTelemetry(unittest.TestCase):
@@ -95,8 +108,219 @@ class TestTelemetry(unittest.TestCase):
     def test_velocity_property(self):
         self.assertEqual(self.telemetry.velocity, Vector3D(4.0, 5.0, 6.0))
 
+    def test_flag_properties(self):
+        # flags=39 sets bits 0, 1, 2 and 5
+        self.assertTrue(self.telemetry.cars_on_track)
+        self.assertTrue(self.telemetry.is_paused)
+        self.assertTrue(self.telemetry.is_loading)
+        self.assertFalse(self.telemetry.in_gear)
+        self.assertFalse(self.telemetry.has_turbo)
+        self.assertTrue(self.telemetry.rev_limit)
+        self.assertFalse(self.telemetry.tcs_active)
+
+    def test_flag_tables_agree(self):
+        for bit, name in enumerate(Telemetry._FLAG_NAMES):
+            t = replace(self.telemetry, flags=1 << bit)
+            set_flags = [n for n in Telemetry._FLAG_NAMES if getattr(t, n)]
+            self.assertEqual(set_flags, [name])
+            self.assertIs(t.as_dict[name], True)
+            self.assertEqual(sum(t._flag_bits), 1)
+            self.assertTrue(t._flag_bits[bit])
+        batch = TelemetryBatch.from_packets([replace(self.telemetry, flags=1 << 13)])
+        self.assertEqual(batch.decode_flags()["unknown_bool_2"], [True])
+        self.assertEqual(batch.decode_flags()["unknown_bool_1"], [False])
+
+    def packet_body(self, byte_order="<"):
+        return struct.pack(byte_order + PACKET_FORMAT, *Telemetry._get_fields(self.telemetry))
+
+    def test_from_buffer(self):
+        for order, code in (("little", "<"), ("big", ">")):
+            body = self.packet_body(code)
+            self.assertEqual(len(body), 292)
+            t = Telemetry.from_buffer(body, byte_order=order)
+            self.assertEqual(t, self.telemetry)
+            # Wire offsets within the body (packet offset - 4 byte header)
+            self.assertEqual(struct.unpack_from(code + "f", body, 0x48)[0], t.speed_mps)
+            self.assertEqual(struct.unpack_from(code + "i", body, 0x6C)[0], t.packet_id)
+            self.assertEqual(struct.unpack_from(code + "i", body, 0x120)[0], t.car_code)
+            self.assertEqual(Telemetry.from_buffer(b"0S7G" + body, 4, order), t)
+
+    def test_from_buffer_matches_client_parsing(self):
+        client = object.__new__(TurismoClient)
+        client._crypto = types.SimpleNamespace(decrypt=bytes)
+        client._telem_callback_queue = asyncio.LifoQueue(maxsize=1)
+        client._callback_task = object()
+        for header, order, code in ((b"0S7G", "little", "<"), (b"G6S0", "big", ">")):
+            body = self.packet_body(code)
+            client._handle_data(header + body)
+            self.assertEqual(client.telemetry, Telemetry.from_buffer(body, byte_order=order))
+
+    def test_iter_buffer(self):
+        recording = self.packet_body() * 3
+        packets = list(Telemetry.iter_buffer(recording))
+        self.assertEqual(packets, [self.telemetry] * 3)
+        big = list(Telemetry.iter_buffer(self.packet_body(">") * 2, byte_order="big"))
+        self.assertEqual(big, [self.telemetry] * 2)
+
+    def test_short_buffers_raise(self):
+        body = self.packet_body()
+        with self.assertRaises(struct.error):
+            Telemetry.from_buffer(body[:-1])
+        with self.assertRaises(struct.error):
+            Telemetry.from_buffer(body, offset=4)
+        with self.assertRaises(struct.error):
+            list(Telemetry.iter_buffer(body + body[:100]))
+
+    def test_as_dict_is_not_shared(self):
+        d = self.telemetry.as_dict
+        d.pop("position")
+        d["car_code"] = 0
+        self.assertEqual(self.telemetry.as_dict["position"], Vector3D(1.0, 2.0, 3.0))
+        self.assertEqual(self.telemetry.as_dict["car_code"], 80)
+
+        t = replace(self.telemetry)
+        t.as_dict
+        t.speed_mps = 10.0
+        self.assertAlmostEqual(t.as_dict["speed_kph"], 36.0)
+
+    def test_to_dict(self):
+        full = self.telemetry.to_dict()
+        self.assertEqual(full, self.telemetry.as_dict)
+        self.assertIsNot(full, self.telemetry.as_dict)
+
+        subset = self.telemetry.to_dict(["position", "speed_kph", "is_paused", "car_code"])
+        self.assertEqual(list(subset), ["position", "speed_kph", "is_paused", "car_code"])
+        self.assertEqual(subset["position"], Vector3D(1.0, 2.0, 3.0))
+        self.assertAlmostEqual(subset["speed_kph"], 19.0 * 3.6)
+        self.assertTrue(subset["is_paused"])
+        self.assertEqual(subset["car_code"], 80)
+
+    def test_to_dict_flat(self):
+        flat = self.telemetry.to_dict(flat=True)
+        self.assertEqual(flat.keys(), self.telemetry.as_dict.keys())
+        self.assertEqual(flat["position"], [1.0, 2.0, 3.0])
+        self.assertIs(type(flat["tire_temp"]), list)
+        self.assertEqual(flat["tire_temp"], [24.0, 25.0, 26.0, 27.0])
+        self.assertEqual(flat["best_lap_time"], self.telemetry.best_lap_time)
+
+        subset = self.telemetry.to_dict(["velocity", "current_gear"], flat=True)
+        self.assertEqual(subset, {"velocity": [4.0, 5.0, 6.0], "current_gear": 8})
+
+    def test_from_dict(self):
+        d = self.telemetry.to_dict()
+        before = dict(d)
+        t = Telemetry.from_dict(d)
+        self.assertEqual(d, before)
+        # empty and unused1-8 are not part of as_dict and come back as 0
+        unused = {f"unused{i}": 0 for i in range(1, 9)}
+        self.assertEqual(t, replace(self.telemetry, empty=0, **unused))
+
+        with self.assertRaises(TypeError):
+            Telemetry.from_dict({**d, "not_a_field": 1})
+        for key in ("position", "current_gear", "car_code", "speed_kph", "time_of_day",
+                    "is_paused"):
+            missing = dict(d)
+            del missing[key]
+            with self.assertRaises(TypeError):
+                Telemetry.from_dict(missing)
+        for key, value in (("position", [1.0, 2.0]), ("tire_temp", [1.0, 2.0, 3.0, 4.0, 5.0])):
+            with self.assertRaises(TypeError):
+                Telemetry.from_dict({**d, key: value})
+
+        # The unknown flags are optional, as in older as_dict output
+        older = {k: v for k, v in d.items() if not k.startswith("unknown_bool")}
+        self.assertEqual(Telemetry.from_dict(older).flags, 39)
+
+    def test_from_dict_with_bit_15(self):
+        values = Telemetry._get_fields(replace(self.telemetry, flags=-0x8000))
+        t = Telemetry.from_buffer(struct.pack("<" + PACKET_FORMAT, *values))
+        self.assertTrue(t.unknown_bool_4)
+        t2 = Telemetry.from_dict(t.to_dict())
+        self.assertEqual(t2.flags, -0x8000)
+        batch = TelemetryBatch.from_packets([t, t2])
+        self.assertEqual(batch[1], t2)
+
+    def test_from_array(self):
+        values = [float(v) for v in Telemetry._get_fields(self.telemetry)]
+        t = Telemetry.from_array(values)
+        self.assertEqual(t, self.telemetry)
+        self.assertIs(type(t.car_code), int)
+        self.assertIs(type(t.speed_mps), float)
+        with self.assertRaises(ValueError):
+            Telemetry.from_array(values[:-1])
+        with self.assertRaises(ValueError):
+            Telemetry.from_array(values[:-1] + [80.5])
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_array_round_trip(self):
+        array = numpy.asarray(self.telemetry)
+        self.assertEqual(array.shape, (len(Telemetry._FIELD_ORDER),))
+        self.assertEqual(array.dtype, numpy.float64)
+        self.assertEqual(Telemetry.from_array(array), self.telemetry)
+        rows = numpy.stack([numpy.asarray(self.telemetry)] * 2)
+        self.assertEqual(Telemetry.from_array(rows[1]), self.telemetry)
+
     def test_time_formatting(self):
-        pass
+        self.assertEqual(format_time(83456), "01:23.456")
+        self.assertEqual(format_time(-5), "00:00.000")
+        self.assertEqual(format_time_of_day(49530000), "13:45:30")
+        self.assertEqual(format_time_of_day(49530000, use_24hr=True), "01:45:30 PM")
+        self.assertEqual(format_time_of_day(0, use_24hr=True), "12:00:00 AM")
+
+    def test_batch_round_trip(self):
+        batch = TelemetryBatch.from_packets([self.telemetry, self.telemetry])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(list(batch.car_code), [80, 80])
+        self.assertEqual(batch[1], self.telemetry)
+        self.assertIsInstance(batch.tire_temp, WheelMetricColumns)
+        self.assertEqual(list(batch.tire_temp.fl), [24.0, 24.0])
+        self.assertIsInstance(batch.position, Vector3DColumns)
+        self.assertEqual(list(batch.position.z), [3.0, 3.0])
+
+    def test_batch_from_buffer(self):
+        for order, code in (("little", "<"), ("big", ">")):
+            batch = TelemetryBatch.from_buffer(self.packet_body(code) * 3, byte_order=order)
+            self.assertEqual(len(batch), 3)
+            for i in range(3):
+                self.assertEqual(batch[i], self.telemetry)
+            self.assertEqual(list(batch.speed_kph), [self.telemetry.speed_kph] * 3)
+            self.assertEqual(list(batch["speed_mph"]), [self.telemetry.speed_mph] * 3)
+        with self.assertRaises(struct.error):
+            TelemetryBatch.from_buffer(self.packet_body() * 2 + self.packet_body()[:100])
+
+    def test_batch_derive_metrics(self):
+        shifted = replace(self.telemetry, bits=0x53, speed_mps=10.0)
+        metrics = TelemetryBatch.from_packets([self.telemetry, shifted]).derive_metrics()
+        for name, column in metrics.items():
+            self.assertEqual(
+                list(column),
+                [t.compute_derived()[name] for t in (self.telemetry, shifted)],
+            )
+
+    def test_tire_temp_stats(self):
+        hotter = replace(self.telemetry, tire_fl_temp=30.0)
+        stats = TelemetryBatch.from_packets([self.telemetry, hotter]).tire_temp_stats()
+        self.assertEqual(stats["min"].fl, 24.0)
+        self.assertEqual(stats["mean"].fl, 27.0)
+        self.assertEqual(stats["max"].fl, 30.0)
+        self.assertEqual(stats["max"].rr, 27.0)
+        self.assertIsNone(TelemetryBatch.from_packets([]).tire_temp_stats())
+
+    def test_batch_indexing(self):
+        batch = TelemetryBatch.from_packets([self.telemetry] * 3)
+        self.assertEqual(list(batch["car_code"]), [80, 80, 80])
+        with self.assertRaises(KeyError):
+            batch["no_such_column"]
+        self.assertEqual(batch[-1], self.telemetry)
+        with self.assertRaises(IndexError):
+            batch[3]
+        part = batch[1:3]
+        self.assertIsInstance(part, TelemetryBatch)
+        self.assertEqual(len(part), 2)
+        self.assertEqual(part[0], self.telemetry)
+        self.assertEqual(len(batch), 3)
+        with self.assertRaises(TypeError):
+            batch[1.0]
 
     def tearDown(self):
         # Clean up if needed